@@ -4,12 +4,13 @@ Strategy-aware AI controller implementation for Nyasnake.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, Optional, Protocol, Sequence, Tuple
+from typing import AbstractSet, Dict, Iterable, Mapping, Optional, Protocol, Sequence, Tuple
 
 from config import AIConfig, AIPersonality
 from engine import GameState, SnakeState
-from models import Direction, Position
+from models import _DELTAS, _DIRECTIONS, _OPPOSITES, Direction, Position
 from pathfinding import find_path
 
 
@@ -108,12 +109,15 @@ class DefensiveStrategy(BalancedStrategy):
             if not safe_directions:
                 return snake.direction
 
+        # Rival heads are the same for every candidate move, so gather them once per decision.
+        head = snake.head()
+        rival_heads = _rival_heads(state, snake)
         best_direction: Optional[Direction] = None
         best_score = float("-inf")
         for direction in safe_directions:
-            next_head = snake.head() + direction
+            next_head = head + direction
             space = _available_space(state, snake, direction, context.ai_config)
-            distance = _distance_to_nearest_enemy(state, snake, next_head)
+            distance = _distance_to_nearest_enemy(rival_heads, next_head, head)
             score = (space * 2) + distance
             if score > best_score:
                 best_score = score
@@ -154,11 +158,18 @@ class GreedyAIController:
         self._ai_config = ai_config
         self._strategy_factory = strategy_factory or StrategyFactory()
 
-    def decide(self, state: GameState) -> Dict[int, Direction]:
+    def decide(
+        self,
+        state: GameState,
+        snake_ids: Optional[AbstractSet[int]] = None,
+    ) -> Dict[int, Direction]:
+        """Plan for every alive snake, or only for ``snake_ids`` when given."""
         decisions: Dict[int, Direction] = {}
         for snake in state.snakes:
             if not snake.alive:
                 continue
+            if snake_ids is not None and snake.id not in snake_ids:
+                continue
             decisions[snake.id] = self._decide_for_snake(state, snake)
         return decisions
 
@@ -180,12 +191,12 @@ def _choose_toward_target(
     best_direction: Optional[Direction] = None
     best_score: Optional[Tuple[int, int]] = None
     head = snake.head()
+    current_distance = head.distance_to(target)
 
     for direction in options:
         next_head = head + direction
         path = find_path(state, snake.id, next_head, target)
         if path is None:
-            current_distance = head.distance_to(target)
             next_distance = next_head.distance_to(target)
             if next_distance >= current_distance:
                 continue
@@ -202,36 +213,49 @@ def _choose_toward_target(
     return best_direction
 
 
-def _safe_directions(state: GameState, snake: SnakeState) -> list[Direction]:
-    head = snake.head()
-    safe: list[Direction] = []
-    for direction in Direction:
-        if snake.length() > 1 and direction == snake.direction.opposite():
-            continue
-        candidate = head + direction
-        if not state.is_within_bounds(candidate):
-            continue
-        if _is_cell_safe(state, snake, candidate):
-            safe.append(direction)
-    return safe
-
-
-def _permissive_directions(state: GameState, snake: SnakeState) -> list[Direction]:
+def _safe_directions(state: GameState, snake: SnakeState) -> Tuple[Direction, ...]:
+    reverse = _OPPOSITES[snake.direction] if snake.length() > 1 else None
+    return _open_directions(state, snake, reverse, allow_tail=True)
+
+
+def _permissive_directions(state: GameState, snake: SnakeState) -> Tuple[Direction, ...]:
+    return _open_directions(state, snake, None, allow_tail=False)
+
+
+def _open_directions(
+    state: GameState,
+    snake: SnakeState,
+    skip: Optional[Direction],
+    allow_tail: bool,
+) -> Tuple[Direction, ...]:
+    """Directions other than ``skip`` whose target cell is in bounds and safe to enter."""
     head = snake.head()
-    options: list[Direction] = []
-    for direction in Direction:
-        candidate = head + direction
-        if not state.is_within_bounds(candidate):
-            continue
-        if _is_cell_safe(state, snake, candidate, allow_tail=False):
-            options.append(direction)
-    return options
+    x = head.x
+    y = head.y
+    max_x = state.width - 1
+    max_y = state.height - 1
+    return tuple(
+        direction
+        for direction, (dx, dy) in zip(_DIRECTIONS, _DELTAS)
+        if direction is not skip
+        and 0 < x + dx < max_x
+        and 0 < y + dy < max_y
+        and _is_cell_safe(state, snake, Position(x + dx, y + dy), allow_tail)
+    )
 
 
 def _nearest_food(state: GameState, head: Position) -> Optional[Position]:
-    if not state.food:
-        return None
-    return min(state.food, key=lambda food: head.distance_to(food))
+    hx = head.x
+    hy = head.y
+    best: Optional[Position] = None
+    best_distance = 0
+    # Strict comparison keeps the first minimum, matching min() tie-breaking.
+    for food in state.food:
+        distance = abs(food.x - hx) + abs(food.y - hy)
+        if best is None or distance < best_distance:
+            best = food
+            best_distance = distance
+    return best
 
 
 def _nearest_rival(state: GameState, snake: SnakeState) -> Optional[SnakeState]:
@@ -246,15 +270,22 @@ def _nearest_rival(state: GameState, snake: SnakeState) -> Optional[SnakeState]:
     return min(opponents, key=lambda other: head.distance_to(other.head()))
 
 
-def _distance_to_nearest_enemy(state: GameState, snake: SnakeState, position: Position) -> int:
-    distances = [
-        position.distance_to(other.head())
+def _rival_heads(state: GameState, snake: SnakeState) -> list[Position]:
+    return [
+        other.head()
         for other in state.snakes
         if other.alive and other.id != snake.id
     ]
-    if not distances:
-        return position.distance_to(snake.head())
-    return min(distances)
+
+
+def _distance_to_nearest_enemy(
+    rival_heads: Sequence[Position],
+    position: Position,
+    own_head: Position,
+) -> int:
+    if not rival_heads:
+        return position.distance_to(own_head)
+    return min(position.distance_to(rival) for rival in rival_heads)
 
 
 def _available_space(
@@ -263,21 +294,23 @@ def _available_space(
     direction: Direction,
     ai_config: AIConfig,
 ) -> int:
-    from collections import deque
-
     head = snake.head() + direction
-    frontier = deque([head])
-    visited = {pos for pos in snake.body}
-    visited.add(head)
-
-    while frontier and len(visited) < ai_config.SPACE_SEARCH_LIMIT:
+    width = state.width
+    blocked = state.occupancy_grid()
+    steps = tuple(dy * width + dx for dx, dy in _DELTAS)
+    limit = ai_config.SPACE_SEARCH_LIMIT
+    start = head.y * width + head.x
+    frontier = deque([start])
+    visited = set(state.body_keys(snake.id))
+    visited.add(start)
+
+    while frontier and len(visited) < limit:
         current = frontier.popleft()
-        for neighbor in current.neighbors():
-            if neighbor in visited:
-                continue
-            if not state.is_within_bounds(neighbor):
-                continue
-            if not _is_cell_safe(state, snake, neighbor):
+        for step in steps:
+            neighbor = current + step
+            # Walls ring the grid, so no bounds check is needed. The snake's own cells are
+            # pre-seeded into visited, so any occupant left is a rival.
+            if blocked[neighbor] or neighbor in visited:
                 continue
             visited.add(neighbor)
             frontier.append(neighbor)
@@ -5,16 +5,28 @@ Provides immutable state structures and deterministic tick transitions.
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
-from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
 from random import Random
 
-from models import Direction, Position
+from models import _OPPOSITES, Direction, Position
 
+# occupancy_grid() cell values: a snake segment, and the board's border.
+_OCCUPIED = 1
+_WALL = 2
 
-@dataclass(frozen=True)
+# Shared empty food set, so food-less states and ticks do not each allocate one.
+_EMPTY_FOOD: FrozenSet[Position] = frozenset()
+
+# Random draws per food item before _spawn_food falls back to scanning for free cells.
+_SPAWN_ATTEMPTS = 16
+
+# GameState.path_cache() entries: (snake id, start, goal) -> path excluding start, or None.
+PathKey = Tuple[int, Position, Position]
+CachedPath = Optional[Tuple[Position, ...]]
+
+
+@dataclass(frozen=True, slots=True)
 class SnakeState:
     """Immutable snake state used by the engine."""
 
@@ -32,16 +44,36 @@ class SnakeState:
         return len(self.body)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
+class _DerivedData:
+    """Mutable memo slots behind GameState's derived-data accessors."""
+
+    occupancy_grid: Optional[bytes] = None
+    paths: Dict[PathKey, CachedPath] = field(default_factory=dict)
+    body_keys: Dict[int, FrozenSet[int]] = field(default_factory=dict)
+
+    def clear(self) -> None:
+        self.occupancy_grid = None
+        self.paths.clear()
+        self.body_keys.clear()
+
+
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Immutable snapshot of the board."""
 
     snakes: Tuple[SnakeState, ...]
     food: frozenset
+    # A plain dict, read-only by convention (hence Mapping): no proxy sits between the
+    # engine and AI lookups, and nothing mutates it after the state is built.
     occupied: Mapping[Position, int]
     width: int
     height: int
     frame: int = 0
+    # Derived data memoised per snapshot; safe because every other field is immutable.
+    _derived: _DerivedData = field(
+        default_factory=_DerivedData, init=False, repr=False, compare=False
+    )
 
     def is_within_bounds(self, pos: Position) -> bool:
         return 0 < pos.x < self.width - 1 and 0 < pos.y < self.height - 1
@@ -49,6 +81,55 @@ class GameState:
     def is_occupied(self, pos: Position) -> bool:
         return pos in self.occupied
 
+    def release_caches(self) -> None:
+        """
+        Drop data memoised on this snapshot (occupancy grid, paths, body keys).
+
+        Call once a state has been advanced past: its derived data is only needed while
+        deciding its tick, and a retained snapshot (e.g. in history) should not keep it.
+        Accessors rebuild on demand if the state is queried again.
+        """
+        self._derived.clear()
+
+    def occupancy_grid(self) -> bytes:
+        """
+        Flat ``y * width + x`` grid of the board, built once per state.
+
+        Cells hold ``_OCCUPIED`` for snake segments, ``_WALL`` for the border, and 0
+        otherwise. One extra row of walls follows the last cell, so a single step off
+        any edge (through negative indexing, for the top) still lands on a wall.
+        """
+        grid = self._derived.occupancy_grid
+        if grid is None:
+            width = self.width
+            height = self.height
+            cells = bytearray([_WALL]) * (width * height + width)
+            interior = bytes(max(width - 2, 0))
+            for y in range(1, height - 1):
+                row = y * width
+                cells[row + 1 : row + width - 1] = interior
+            for pos in self.occupied:
+                if 0 < pos.x < width - 1 and 0 < pos.y < height - 1:
+                    cells[pos.y * width + pos.x] = _OCCUPIED
+            grid = self._derived.occupancy_grid = bytes(cells)
+        return grid
+
+    def path_cache(self) -> Dict[PathKey, CachedPath]:
+        """Pathfinding memo for this snapshot, filled and read by ``find_path``."""
+        return self._derived.paths
+
+    def body_keys(self, snake_id: int) -> FrozenSet[int]:
+        """Packed ``y * width + x`` keys of a snake's body, computed once per state."""
+        keys = self._derived.body_keys.get(snake_id)
+        if keys is None:
+            snake = self.find_snake(snake_id)
+            width = self.width
+            keys = frozenset(
+                segment.y * width + segment.x for segment in (snake.body if snake else ())
+            )
+            self._derived.body_keys[snake_id] = keys
+        return keys
+
     def find_snake(self, snake_id: int) -> Optional[SnakeState]:
         return next((s for s in self.snakes if s.id == snake_id), None)
 
@@ -81,13 +162,44 @@ class TickResult:
 
 
 def _build_occupancy(snakes: Iterable[SnakeState]) -> Mapping[Position, int]:
+    # Returned as a plain dict; see GameState.occupied.
     occupied: Dict[Position, int] = {}
     for snake in snakes:
         if not snake.alive:
             continue
         for segment in snake.body:
             occupied[segment] = snake.id
-    return MappingProxyType(occupied)
+    return occupied
+
+
+def _advance_occupancy(
+    previous: GameState,
+    next_snakes: Sequence[SnakeState],
+) -> Mapping[Position, int]:
+    """
+    Derive the next occupancy map from the previous one by applying per-snake diffs.
+
+    A surviving snake only gains its new head and, unless it grew, loses its old
+    tail; a snake that died this tick releases its whole body. ``next_snakes`` must
+    be in the same order as ``previous.snakes``. Cells are only released while they
+    still belong to the snake releasing them, so a rival's new head is never erased.
+    """
+    occupied = dict(previous.occupied)
+    for before, after in zip(previous.snakes, next_snakes):
+        if not before.alive:
+            continue
+        snake_id = before.id
+        if not after.alive:
+            for segment in before.body:
+                if occupied.get(segment) == snake_id:
+                    del occupied[segment]
+            continue
+        if len(after.body) == len(before.body):
+            tail = before.body[-1]
+            if occupied.get(tail) == snake_id:
+                del occupied[tail]
+        occupied[after.body[0]] = snake_id
+    return occupied
 
 
 def create_initial_state(
@@ -102,7 +214,7 @@ def create_initial_state(
         SnakeState(id=spawn.id, body=spawn.body, direction=spawn.direction)
         for spawn in spawns
     )
-    food = _spawn_food(width, height, snakes, frozenset(), initial_food, rng)
+    food = _spawn_food(width, height, snakes, _EMPTY_FOOD, initial_food, rng)
     occupied = _build_occupancy(snakes)
     return GameState(snakes=snakes, food=food, occupied=occupied, width=width, height=height)
 
@@ -112,7 +224,10 @@ def _movement_phase(
     decisions: Mapping[int, Direction]
 ) -> tuple[list[SnakeState], set[Position], list[GameEvent]]:
     """Move all snakes according to decisions, handling food consumption."""
-    moved = []
+    moved: list[SnakeState] = []
+    # A working copy: the AI breaks distance ties by food iteration order, so the next
+    # state's frozenset must be built from this set (as it always has been) to keep seeded
+    # games reproducible.
     food = set(state.food)
     generated_events: list[GameEvent] = []
 
@@ -121,18 +236,21 @@ def _movement_phase(
             moved.append(snake)  # dead snakes persist as corpses
             continue
 
-        direction = decisions.get(snake.id, snake.direction)
-        if direction == snake.direction.opposite():
-            direction = snake.direction
+        current = snake.direction
+        direction = decisions.get(snake.id, current)
+        # Direction is an IntEnum, so the reversal check is a tuple index and an int compare.
+        if direction == _OPPOSITES[current]:
+            direction = current
 
-        body_deque = deque(snake.body)
-        new_head = snake.head() + direction
-        body_deque.appendleft(new_head)
+        body = snake.body
+        new_head = body[0] + direction
 
+        # One tuple build per move: prepend the head, and drop the tail unless the snake grows.
         ate_food = new_head in food
         if not ate_food:
-            body_deque.pop()
+            body = (new_head,) + body[:-1]
         else:
+            body = (new_head,) + body
             food.remove(new_head)
             generated_events.append(
                 GameEvent(type="food_consumed", snake_id=snake.id, position=new_head)
@@ -141,7 +259,7 @@ def _movement_phase(
         moved.append(
             SnakeState(
                 id=snake.id,
-                body=tuple(body_deque),
+                body=body,
                 direction=direction,
                 score=snake.score + (10 if ate_food else 0),
                 kills=snake.kills,
@@ -170,7 +288,8 @@ def _wall_collision_phase(
                 GameEvent(type="snake_died", snake_id=snake.id, position=head)
             )
             continue
-        if head in snake.body[1:]:
+        # The head sits at index 0, so a second occurrence means it hit its own body.
+        if snake.body.count(head) > 1:
             alive_flags[snake.id] = False
             generated_events.append(
                 GameEvent(type="snake_died", snake_id=snake.id, position=head)
@@ -181,18 +300,23 @@ def _head_collision_phase(
     moved: list[SnakeState], 
     alive_flags: Dict[int, bool], 
     lengths: Dict[int, int], 
-    generated_events: list[GameEvent]
-) -> list[SnakeState]:
+    kill_counts: Dict[int, int],
+    generated_events: list[GameEvent],
+    width: int,
+) -> None:
     """Handle head-to-head collisions between snakes."""
-    head_positions: Dict[Position, list] = {}
+    # Heads are bucketed by packed ``y * width + x`` keys, which hash far cheaper than Positions.
+    head_cells: Dict[int, List[int]] = {}
     for snake in moved:
         if not alive_flags.get(snake.id, False):
             continue
-        head_positions.setdefault(snake.head(), []).append(snake.id)
+        head = snake.body[0]
+        head_cells.setdefault(head.y * width + head.x, []).append(snake.id)
 
-    for position, contenders in head_positions.items():
+    for key, contenders in head_cells.items():
         if len(contenders) <= 1:
             continue
+        position = Position(key % width, key // width)
         best_length = max(lengths[snake_id] for snake_id in contenders)
         survivors = [
             snake_id
@@ -212,7 +336,7 @@ def _head_collision_phase(
                         GameEvent(type="snake_died", snake_id=snake_id, position=position)
                     )
             if win_count > 0:
-                moved = _award_kill(moved, winner, win_count)
+                kill_counts[winner] = kill_counts.get(winner, 0) + win_count
         else:
             for snake_id in contenders:
                 if alive_flags.get(snake_id, False):
@@ -221,55 +345,59 @@ def _head_collision_phase(
                         GameEvent(type="snake_died", snake_id=snake_id, position=position)
                     )
 
-    return moved
-
 
 def _body_collision_phase(
     moved: list[SnakeState], 
     alive_flags: Dict[int, bool], 
-    generated_events: list[GameEvent]
-) -> list[SnakeState]:
+    kill_counts: Dict[int, int],
+    generated_events: list[GameEvent],
+    width: int,
+) -> None:
     """Handle collisions with other snakes' bodies."""
-    body_positions: Dict[Position, int] = {}
+    body_cells: Dict[int, int] = {}
     for snake in moved:
         if not alive_flags.get(snake.id, False):
             continue
+        snake_id = snake.id
         for segment in snake.body[1:]:
-            body_positions.setdefault(segment, snake.id)
+            body_cells.setdefault(segment.y * width + segment.x, snake_id)
 
     for snake in moved:
         if not alive_flags.get(snake.id, False):
             continue
         head = snake.head()
-        occupant = body_positions.get(head)
+        occupant = body_cells.get(head.y * width + head.x)
         if occupant is not None and occupant != snake.id:
             alive_flags[snake.id] = False
             generated_events.append(
                 GameEvent(type="snake_died", snake_id=snake.id, position=head)
             )
-            moved = _award_kill(moved, occupant, 1)
-
-    return moved
+            kill_counts[occupant] = kill_counts.get(occupant, 0) + 1
 
 
-def _apply_death_flags(moved: list[SnakeState], alive_flags: Dict[int, bool]) -> list[SnakeState]:
-    """Apply death flags to create final snake states."""
+def _apply_death_flags(
+    moved: list[SnakeState],
+    alive_flags: Dict[int, bool],
+    kill_counts: Mapping[int, int],
+) -> list[SnakeState]:
+    """Apply death flags and awarded kills, rebuilding each changed snake once."""
     next_snakes = []
     for snake in moved:
         is_alive = alive_flags.get(snake.id, False) and snake.alive
-        if not is_alive:
-            next_snakes.append(
-                SnakeState(
-                    id=snake.id,
-                    body=snake.body,
-                    direction=snake.direction,
-                    alive=False,
-                    score=snake.score,
-                    kills=snake.kills,
-                )
-            )
-        else:
+        awarded = kill_counts.get(snake.id, 0)
+        if is_alive and not awarded:
             next_snakes.append(snake)
+            continue
+        next_snakes.append(
+            SnakeState(
+                id=snake.id,
+                body=snake.body,
+                direction=snake.direction,
+                alive=is_alive,
+                score=snake.score,
+                kills=snake.kills + awarded,
+            )
+        )
     return next_snakes
 
 
@@ -291,38 +419,38 @@ def advance_state(
     # Phase 2: Collision detection setup
     alive_flags: Dict[int, bool] = {snake.id: snake.alive for snake in moved}
     lengths: Dict[int, int] = {snake.id: snake.length() for snake in moved}
+    kill_counts: Dict[int, int] = {}
     
     # Phase 3: Wall and self collisions
     _wall_collision_phase(state, moved, alive_flags, generated_events)
     
     # Phase 4: Head-to-head collisions
-    moved = _head_collision_phase(moved, alive_flags, lengths, generated_events)
+    _head_collision_phase(moved, alive_flags, lengths, kill_counts, generated_events, state.width)
     
     # Phase 5: Body collisions
-    moved = _body_collision_phase(moved, alive_flags, generated_events)
+    _body_collision_phase(moved, alive_flags, kill_counts, generated_events, state.width)
     
-    # Phase 6: Apply death flags
-    next_snakes = _apply_death_flags(moved, alive_flags)
+    # Phase 6: Apply death flags and kills
+    next_snakes = _apply_death_flags(moved, alive_flags, kill_counts)
     
     # Phase 7: Food respawn and final state
     alive_snakes = tuple(s for s in next_snakes if s.alive)
     
-    if len(food) < desired_food:
-        food = _spawn_food(
+    next_food = frozenset(food) if food else _EMPTY_FOOD
+    if len(next_food) < desired_food:
+        next_food = _spawn_food(
             state.width,
             state.height,
             alive_snakes,
-            frozenset(food),
-            desired_food - len(food),
+            next_food,
+            desired_food - len(next_food),
             rng,
         )
-    else:
-        food = frozenset(food)
 
-    occupied = _build_occupancy(alive_snakes)
+    occupied = _advance_occupancy(state, next_snakes)
     next_state = GameState(
         snakes=next_snakes,
-        food=food,
+        food=next_food,
         occupied=occupied,
         width=state.width,
         height=state.height,
@@ -336,42 +464,59 @@ def _spawn_food(
     width: int,
     height: int,
     snakes: Sequence[SnakeState],
-    existing_food: frozenset,
+    existing_food: FrozenSet[Position],
     count: int,
     rng: Random,
-) -> frozenset:
-    """Spawn additional food items in free cells."""
-    occupied = {seg for snake in snakes for seg in snake.body}
-    occupied.update(existing_food)
-    available = [
-        Position(x, y)
-        for x in range(1, width - 1)
-        for y in range(1, height - 1)
-        if Position(x, y) not in occupied
-    ]
-    rng.shuffle(available)
+) -> FrozenSet[Position]:
+    """
+    Spawn additional food items in free cells.
+
+    Cells are drawn by rejection sampling against a taken-cell bitmap, which is
+    O(1) expected per item on a sparse board. Once a draw fails
+    ``_SPAWN_ATTEMPTS`` times in a row the board is considered crowded and the
+    remaining items are dealt from a shuffled list of the free cells instead.
+    """
+    if count <= 0 or width < 3 or height < 3:
+        return existing_food
     new_food = list(existing_food)
-    for _ in range(count):
-        if not available:
+
+    # Off-board cells are skipped: they could never be drawn, and packing them would
+    # index past the bitmap or alias onto another row.
+    taken = bytearray(width * height)
+    for snake in snakes:
+        for segment in snake.body:
+            if 0 <= segment.x < width and 0 <= segment.y < height:
+                taken[segment.y * width + segment.x] = 1
+    for item in existing_food:
+        if 0 <= item.x < width and 0 <= item.y < height:
+            taken[item.y * width + item.x] = 1
+
+    randrange = rng.randrange
+    while count > 0:
+        for _ in range(_SPAWN_ATTEMPTS):
+            x = randrange(1, width - 1)
+            y = randrange(1, height - 1)
+            key = y * width + x
+            if not taken[key]:
+                break
+        else:
             break
-        new_food.append(available.pop())
-    return frozenset(new_food)
+        taken[key] = 1
+        new_food.append(Position(x, y))
+        count -= 1
+
+    if count > 0:
+        available = [
+            key
+            for x in range(1, width - 1)
+            for key in range(width + x, (height - 1) * width, width)
+            if not taken[key]
+        ]
+        rng.shuffle(available)
+        for key in available[:count]:
+            new_food.append(Position(key % width, key // width))
+    return frozenset(new_food) if new_food else _EMPTY_FOOD
 
 
 def _is_within_bounds(pos: Position, width: int, height: int) -> bool:
     return 0 < pos.x < width - 1 and 0 < pos.y < height - 1
-
-
-def _award_kill(snakes: Sequence[SnakeState], killer_id: int, kills: int) -> Sequence[SnakeState]:
-    """Award kills to the specified snake, returning a new sequence."""
-    return tuple(
-        SnakeState(
-            id=snake.id,
-            body=snake.body,
-            direction=snake.direction,
-            alive=snake.alive,
-            score=snake.score,
-            kills=snake.kills + kills,
-        ) if snake.id == killer_id else snake
-        for snake in snakes
-    )
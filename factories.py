@@ -4,7 +4,9 @@ Factory utilities for constructing AI controllers and renderers.
 
 from __future__ import annotations
 
-from typing import Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Sequence, Tuple
 
 from ai import GreedyAIController, SnakeStrategy, StrategyFactory
 from config import AIConfig, AIPersonality, DebugConfig, DisplayConfig
@@ -19,18 +21,31 @@ class AIControllerFactory:
         self._strategy_factory = strategy_factory or StrategyFactory()
 
     def create(self, ai_level: str, profiles: Sequence[SnakeProfile]) -> GreedyAIController:
-        strategies = {
-            profile.id: SnakeStrategy(self._select_personality(ai_level, profile.personality))
-            for profile in profiles
-        }
+        signature = tuple((profile.id, profile.personality) for profile in profiles)
+        strategies = _build_strategies(ai_level, signature)
         return GreedyAIController(strategies, self._ai_config, self._strategy_factory)
 
-    def _select_personality(self, ai_level: str, default: AIPersonality) -> AIPersonality:
-        if ai_level == "easy":
-            return AIPersonality.DEFENSIVE
-        if ai_level == "hard":
-            return AIPersonality.AGGRESSIVE
-        return default
+
+@lru_cache(maxsize=32)
+def _build_strategies(
+    ai_level: str,
+    signature: Tuple[Tuple[int, AIPersonality], ...],
+) -> Mapping[int, SnakeStrategy]:
+    """Resolve per-snake strategies; safe to share since SnakeStrategy is frozen."""
+    return MappingProxyType(
+        {
+            snake_id: SnakeStrategy(_select_personality(ai_level, personality))
+            for snake_id, personality in signature
+        }
+    )
+
+
+def _select_personality(ai_level: str, default: AIPersonality) -> AIPersonality:
+    if ai_level == "easy":
+        return AIPersonality.DEFENSIVE
+    if ai_level == "hard":
+        return AIPersonality.AGGRESSIVE
+    return default
 
 
 class RendererFactory:
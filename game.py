@@ -11,7 +11,20 @@ import time
 from collections import deque
 from dataclasses import dataclass
 from random import Random
-from typing import Callable, Deque, Dict, List, Mapping, MutableMapping, Optional, Protocol, Sequence
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
 
 from config import AIPersonality, DebugConfig, DisplayConfig, GameConfig, SpeedRampConfig
 from engine import (
@@ -27,6 +40,20 @@ from models import Direction, Position
 
 logger = logging.getLogger(__name__)
 
+EventHandler = Callable[[GameEvent], None]
+OverrideDecision = Callable[[GameState, SnakeState], Optional[Direction]]
+
+# Shared empty decision map for frames where every alive snake is overridden.
+_NO_DECISIONS: Mapping[int, Direction] = MappingProxyType({})
+
+# Shared empty command batch for the (common) frames without input or overrides.
+_EMPTY_COMMANDS: Tuple[InputCommand, ...] = ()
+
+# Frame pacing: length of each coarse sleep, and how many recent sleeps are tracked to
+# estimate overshoot (a power of two so the ring index wraps with a mask).
+_SLEEP_QUANTUM = 0.001
+_SLEEP_SAMPLES = 64
+
 
 @dataclass(frozen=True)
 class SnakeProfile:
@@ -39,9 +66,18 @@ class SnakeProfile:
 
 
 class DecisionProvider(Protocol):
-    """Callable that produces direction choices for all alive snakes."""
+    """
+    Callable that produces direction choices for alive snakes.
+
+    When ``snake_ids`` is given, only those snakes need a decision; the others are
+    driven by controller overrides and any entries for them are ignored.
+    """
 
-    def decide(self, state: GameState) -> Mapping[int, Direction]:
+    def decide(
+        self,
+        state: GameState,
+        snake_ids: Optional[AbstractSet[int]] = None,
+    ) -> Mapping[int, Direction]:
         ...
 
 
@@ -78,7 +114,7 @@ class InputProvider:
         Collect commands for controllable snakes.
         Default implementation returns no overrides.
         """
-        return ()
+        return _EMPTY_COMMANDS
 
     def close(self) -> None:
         """Hook for releasing terminal resources."""
@@ -92,7 +128,16 @@ class KeyboardInput(InputProvider):
     """
 
     def __init__(self, bindings: Mapping[str, tuple[int, Direction]]):
-        self._bindings = {key.lower(): value for key, value in bindings.items()}
+        # Commands are immutable, so each binding is built once and reused on every press.
+        self._bindings: Dict[str, MoveCommand] = {
+            key.lower(): MoveCommand(snake_id, direction)
+            for key, (snake_id, direction) in bindings.items()
+        }
+        # Latin-1 characters (every plain keypress) resolve by code point through a flat
+        # table; only wider characters fall back to the case-folded dict lookup.
+        self._key_table: List[Optional[MoveCommand]] = [
+            self._bindings.get(chr(code).lower()) for code in range(256)
+        ]
         self._is_windows = os.name == "nt"
         self._fd: Optional[int] = None
         self._tty_attrs = None
@@ -100,12 +145,8 @@ class KeyboardInput(InputProvider):
             self._setup_posix_terminal()
 
     def poll(self) -> Sequence[InputCommand]:
-        commands: list[InputCommand] = []
-        if self._is_windows:
-            commands.extend(self._poll_windows())
-        else:
-            commands.extend(self._poll_posix())
-        return commands
+        commands = self._poll_windows() if self._is_windows else self._poll_posix()
+        return commands or _EMPTY_COMMANDS
 
     def close(self) -> None:
         if not self._is_windows and self._fd is not None and self._tty_attrs is not None:
@@ -132,10 +173,9 @@ class KeyboardInput(InputProvider):
             char = msvcrt.getwch()
             if not char:
                 continue
-            mapping = self._bindings.get(char.lower())
-            if mapping:
-                snake_id, direction = mapping
-                commands.append(MoveCommand(snake_id, direction))
+            command = self._lookup(char)
+            if command is not None:
+                commands.append(command)
         return commands
 
     def _poll_posix(self) -> List[InputCommand]:
@@ -149,12 +189,17 @@ class KeyboardInput(InputProvider):
             char = sys.stdin.read(1)
             if not char:
                 break
-            mapping = self._bindings.get(char.lower())
-            if mapping:
-                snake_id, direction = mapping
-                commands.append(MoveCommand(snake_id, direction))
+            command = self._lookup(char)
+            if command is not None:
+                commands.append(command)
         return commands
 
+    def _lookup(self, char: str) -> Optional[MoveCommand]:
+        code = ord(char)
+        if code < 256:
+            return self._key_table[code]
+        return self._bindings.get(char.lower())
+
     def _setup_posix_terminal(self) -> None:
         if not sys.stdin.isatty():
             return
@@ -206,13 +251,28 @@ class Renderer:
 class AnsiRenderer(Renderer):
     """ANSI terminal renderer used as the default fallback backend."""
 
+    def __init__(
+        self,
+        display_config: DisplayConfig,
+        debug_config: DebugConfig,
+    ):
+        super().__init__(display_config, debug_config)
+        colors = display_config.COLORS
+        self._reset = colors["reset"]
+        self._food_cell = f"{colors['yellow']}{display_config.SYMBOLS['food']}{self._reset}"
+        # Styled cell strings keyed by (color, symbol); the palette is fixed, so each is built once.
+        self._cells: Dict[Tuple[str, str], str] = {}
+
     def render(
         self,
         state: GameState,
         profiles: Mapping[int, SnakeProfile],
         events: Sequence[GameEvent],
     ) -> None:
-        print("\033[2J\033[H", end="")  # clear screen
+        # The frame is composed in memory and written once, so the terminal never shows a
+        # half-drawn board and the renderer makes one write call per frame.
+        parts = ["\033[2J\033[H"]  # clear screen
+        emit = parts.append
 
         grid = [[" " for _ in range(state.width)] for _ in range(state.height)]
         self._draw_border(grid, state.width, state.height)
@@ -220,13 +280,14 @@ class AnsiRenderer(Renderer):
         self._draw_snakes(grid, state, profiles)
 
         for row in grid:
-            print("".join(row))
+            emit("".join(row))
+            emit("\n")
 
-        print("\n" + "=" * state.width)
-        self._print_status(state, profiles)
+        emit("\n" + "=" * state.width + "\n")
+        self._write_status(emit, state, profiles)
         if events and self.debug_config.LOG_DECISIONS:
             for event in events:
-                print(f"  • Event: {event.type} (snake={event.snake_id}, pos={event.position})")
+                emit(f"  • Event: {event.type} (snake={event.snake_id}, pos={event.position})\n")
 
         if any(
             (
@@ -235,25 +296,29 @@ class AnsiRenderer(Renderer):
                 self.debug_config.SHOW_EVALUATION_SCORES,
             )
         ):
-            print(
+            emit(
                 "Debug Mode: "
                 f"danger_zones={self.debug_config.SHOW_DANGER_ZONES}, "
                 f"paths={self.debug_config.SHOW_PATHS}, "
-                f"scores={self.debug_config.SHOW_EVALUATION_SCORES}"
+                f"scores={self.debug_config.SHOW_EVALUATION_SCORES}\n"
             )
 
         alive_count = sum(1 for snake in state.snakes if snake.alive)
         if alive_count <= 1:
-            print("\n" + "=" * state.width)
+            emit("\n" + "=" * state.width + "\n")
             if alive_count == 1:
                 winner = next(s for s in state.snakes if s.alive)
                 profile = profiles[winner.id]
                 name = profile.personality.name
-                print(f"🏆 {name} Snake Wins!")
+                emit(f"🏆 {name} Snake Wins!\n")
             else:
-                print("All snakes eliminated!")
+                emit("All snakes eliminated!\n")
+
+        emit(f"\nFrame: {state.frame}\n")
 
-        print(f"\nFrame: {state.frame}")
+        stream = sys.stdout
+        stream.write("".join(parts))
+        stream.flush()
 
     def _draw_border(self, grid: list[list[str]], width: int, height: int) -> None:
         symbols = self.display_config.SYMBOLS
@@ -269,13 +334,10 @@ class AnsiRenderer(Renderer):
         grid[height - 1][width - 1] = symbols["corner_br"]
 
     def _draw_food(self, grid: list[list[str]], state: GameState) -> None:
+        food_cell = self._food_cell
         for food_pos in state.food:
             if 0 <= food_pos.y < state.height and 0 <= food_pos.x < state.width:
-                grid[food_pos.y][food_pos.x] = (
-                    f"{self.display_config.COLORS['yellow']}"
-                    f"{self.display_config.SYMBOLS['food']}"
-                    f"{self.display_config.COLORS['reset']}"
-                )
+                grid[food_pos.y][food_pos.x] = food_cell
 
     def _draw_snakes(
         self,
@@ -289,13 +351,25 @@ class AnsiRenderer(Renderer):
             if not profile:
                 continue
             color = profile.color if snake.alive else self.display_config.COLORS["gray"]
+            head_cell = self._styled_cell(color, profile.symbol)
+            body_cell = self._styled_cell(color, body_symbol)
             for index, segment in enumerate(snake.body):
                 if not (0 <= segment.x < state.width and 0 <= segment.y < state.height):
                     continue
-                symbol = profile.symbol if index == 0 else body_symbol
-                grid[segment.y][segment.x] = f"{color}{symbol}{self.display_config.COLORS['reset']}"
+                grid[segment.y][segment.x] = head_cell if index == 0 else body_cell
+
+    def _styled_cell(self, color: str, symbol: str) -> str:
+        cell = self._cells.get((color, symbol))
+        if cell is None:
+            cell = self._cells[(color, symbol)] = f"{color}{symbol}{self._reset}"
+        return cell
 
-    def _print_status(self, state: GameState, profiles: Mapping[int, SnakeProfile]) -> None:
+    def _write_status(
+        self,
+        emit: Callable[[str], None],
+        state: GameState,
+        profiles: Mapping[int, SnakeProfile],
+    ) -> None:
         for snake in state.snakes:
             profile = profiles.get(snake.id)
             if not profile:
@@ -303,10 +377,10 @@ class AnsiRenderer(Renderer):
             status = "ALIVE" if snake.alive else "DEAD"
             color = profile.color if snake.alive else self.display_config.COLORS["gray"]
             personality_name = profile.personality.name
-            print(
+            emit(
                 f"{color}{personality_name:11} Snake: {status:5} | "
                 f"Score: {snake.score:4} | Length: {snake.length():3} | "
-                f"Kills: {snake.kills}{self.display_config.COLORS['reset']}"
+                f"Kills: {snake.kills}{self.display_config.COLORS['reset']}\n"
             )
 
 
@@ -323,12 +397,11 @@ class StateHistory:
 
     def __init__(self, capacity: Optional[int] = None) -> None:
         self._capacity = capacity
-        self._history: Deque[StateMemento] = deque()
+        # A bounded deque evicts the oldest memento itself on append.
+        self._history: Deque[StateMemento] = deque(maxlen=capacity)
 
     def record(self, state: GameState) -> None:
         self._history.append(StateMemento(frame=state.frame, state=state))
-        if self._capacity is not None and len(self._history) > self._capacity:
-            self._history.popleft()
 
     def rewind(self, steps: int = 1) -> Optional[StateMemento]:
         if steps <= 0 or steps > len(self._history):
@@ -344,7 +417,12 @@ class StateHistory:
 
 
 class GameEventVisitor(Protocol):
-    """Visitor interface for processing game events."""
+    """
+    Visitor interface for processing game events.
+
+    Visitors may also define ``on_<event type>`` methods (e.g. ``on_snake_died``);
+    those take precedence over ``visit`` for events of that type.
+    """
 
     def visit(self, event: GameEvent) -> None:
         ...
@@ -354,23 +432,46 @@ class EventDispatcher:
     """Coordinates event propagation via visitors and legacy listeners."""
 
     def __init__(self) -> None:
-        self._listeners: list[Callable[[TickResult], None]] = []
-        self._visitors: list[GameEventVisitor] = []
+        # Listeners are rebound as a tuple on registration; a lone listener (the common
+        # case) is also kept on its own so dispatch can skip the loop entirely.
+        self._listeners: tuple[Callable[[TickResult], None], ...] = ()
+        self._single_listener: Optional[Callable[[TickResult], None]] = None
+        # Per visitor: an event-type -> handler table resolved once at registration, plus the
+        # generic ``visit`` fallback for types without a dedicated handler.
+        self._visitors: list[tuple[Dict[str, EventHandler], Optional[EventHandler]]] = []
 
     def register_listener(self, listener: Callable[[TickResult], None]) -> None:
-        self._listeners.append(listener)
+        self._listeners += (listener,)
+        self._single_listener = listener if len(self._listeners) == 1 else None
 
     def register_visitor(self, visitor: GameEventVisitor) -> None:
-        self._visitors.append(visitor)
+        handlers = {
+            name[3:]: getattr(visitor, name)
+            for name in dir(visitor)
+            if name.startswith("on_") and callable(getattr(visitor, name))
+        }
+        self._visitors.append((handlers, getattr(visitor, "visit", None)))
 
     def dispatch(self, tick: TickResult) -> None:
         for event in tick.events:
-            for visitor in self._visitors:
+            event_type = event.type
+            for handlers, fallback in self._visitors:
+                handler = handlers.get(event_type, fallback)
+                if handler is None:
+                    continue
                 try:
-                    visitor.visit(event)
+                    handler(event)
                 except Exception:
                     logger.warning("Event visitor raised an exception", exc_info=True)
 
+        single = self._single_listener
+        if single is not None:
+            try:
+                single(tick)
+            except Exception:
+                logger.warning("Event listener raised an exception", exc_info=True)
+            return
+
         for listener in self._listeners:
             try:
                 listener(tick)
@@ -386,47 +487,76 @@ class DecisionCollector:
         decision_provider: DecisionProvider,
         input_provider: Optional[InputProvider],
         overrides: Optional[Mapping[int, SnakeController]] = None,
+        history_capacity: Optional[int] = None,
     ):
         self._decision_provider = decision_provider
         self._input_provider = input_provider
         self._overrides: Dict[int, SnakeController] = dict(overrides or {})
-        self._command_history: list[list[InputCommand]] = []
-
-    def collect(self, state: GameState) -> Dict[int, Direction]:
-        decisions = dict(self._decision_provider.decide(state))
-        commands: list[InputCommand] = []
-
+        self._override_calls: tuple[tuple[int, OverrideDecision], ...] = ()
+        self._refresh_override_calls()
+        # Frozen per-frame command batches; bounded like StateHistory when a capacity is given.
+        self._command_history: Deque[tuple[InputCommand, ...]] = deque(maxlen=history_capacity)
+
+    def collect(self, state: GameState) -> Mapping[int, Direction]:
+        # Overrides are resolved first so the provider can skip the snakes they already
+        # drive; a controller that returns None still falls back to the provider.
+        override_commands = self._collect_override_commands(state)
+        if not override_commands:
+            base = self._decision_provider.decide(state)
+        else:
+            overridden = {command.snake_id for command in override_commands}
+            targets = frozenset(
+                snake.id for snake in state.snakes if snake.alive and snake.id not in overridden
+            )
+            base = self._decision_provider.decide(state, targets) if targets else _NO_DECISIONS
+        polled: Sequence[InputCommand] = _EMPTY_COMMANDS
         if self._input_provider is not None:
             try:
-                commands.extend(self._input_provider.poll())
+                polled = self._input_provider.poll()
             except OSError as exc:  # pragma: no cover - platform specific
                 logger.warning("Input provider failed: %s", exc)
 
-        commands.extend(self._collect_override_commands(state))
+        # Input first, then overrides, so controllers win over keys for the same snake.
+        commands: Tuple[InputCommand, ...] = _EMPTY_COMMANDS
+        if polled or override_commands:
+            commands = (*polled, *override_commands)
+        self._command_history.append(commands)
 
+        # Provider results are treated as read-only; copy only when a command needs to write.
+        if not commands:
+            return base
+        decisions = dict(base)
         for command in commands:
             command.apply(decisions)
-
-        self._command_history.append(commands)
         return decisions
 
     def update_override(self, snake_id: int, controller: SnakeController) -> None:
         self._overrides[snake_id] = controller
+        self._refresh_override_calls()
 
     def remove_override(self, snake_id: int) -> None:
         self._overrides.pop(snake_id, None)
+        self._refresh_override_calls()
 
     def history(self) -> Sequence[Sequence[InputCommand]]:
-        return tuple(tuple(cmds) for cmds in self._command_history)
+        return tuple(self._command_history)
+
+    def _refresh_override_calls(self) -> None:
+        # Bound decide methods resolved once per registration change, not once per tick.
+        self._override_calls = tuple(
+            (snake_id, controller.decide) for snake_id, controller in self._overrides.items()
+        )
 
-    def _collect_override_commands(self, state: GameState) -> list[InputCommand]:
-        commands: list[InputCommand] = []
+    def _collect_override_commands(self, state: GameState) -> list[MoveCommand]:
+        commands: list[MoveCommand] = []
+        if not self._override_calls:
+            return commands
         snakes_by_id = {snake.id: snake for snake in state.snakes if snake.alive}
-        for snake_id, controller in self._overrides.items():
+        for snake_id, decide in self._override_calls:
             snake = snakes_by_id.get(snake_id)
             if snake is None:
                 continue
-            override = controller.decide(state, snake)
+            override = decide(state, snake)
             if override is not None:
                 commands.append(MoveCommand(snake_id, override))
         return commands
@@ -462,7 +592,15 @@ class GameLoop:
         self._state = initial_state
         self._game_over = False
         self._speed_ramp_config = speed_ramp_config
-        self._frames_since_last_ramp = 0
+        self._next_ramp_frame: float = (
+            initial_state.frame + speed_ramp_config.ramp_interval
+            if speed_ramp_config and speed_ramp_config.enabled
+            else float("inf")
+        )
+        # Ring of observed time.sleep(_SLEEP_QUANTUM) durations and their running maximum.
+        self._sleep_samples = [_SLEEP_QUANTUM] * _SLEEP_SAMPLES
+        self._sleep_sample_index = 0
+        self._worst_sleep = _SLEEP_QUANTUM
 
     @property
     def state(self) -> GameState:
@@ -474,17 +612,21 @@ class GameLoop:
         return self._current_tick_interval
 
     def run(self) -> GameState:
+        # One clock reading per frame: pacing hands back the time it finished waiting,
+        # which doubles as the next frame's start.
+        frame_start = time.perf_counter()
         while not self._should_stop():
-            frame_start = time.perf_counter()
             self._history.record(self._state)
             decisions = self._decision_collector.collect(self._state)
             tick = advance_state(self._state, decisions, self._rng, self._desired_food)
+            # The tick is decided; history keeps the snapshot but not its AI-side memos.
+            self._state.release_caches()
             self._state = tick.state
             self._history.record(self._state)
             self._event_dispatcher.dispatch(tick)
             self._renderer.render(tick.state, self._profiles, tick.events)
             self._apply_speed_ramping()
-            self._sleep_until_next_frame(frame_start)
+            frame_start = self._sleep_until_next_frame(frame_start)
         return self._state
 
     def _should_stop(self) -> bool:
@@ -502,39 +644,70 @@ class GameLoop:
 
     def _apply_speed_ramping(self) -> None:
         """Apply speed ramping if configured and conditions are met."""
-        if not self._speed_ramp_config or not self._speed_ramp_config.enabled:
+        # Disabled ramping leaves the next ramp frame at infinity, so this is one compare.
+        if self._state.frame < self._next_ramp_frame:
             return
-        
-        self._frames_since_last_ramp += 1
-        
-        if self._frames_since_last_ramp >= self._speed_ramp_config.ramp_interval:
-            # Time to ramp up the speed
-            new_interval = self._current_tick_interval - self._speed_ramp_config.ramp_step
-            # Respect the minimum tick interval (max speed)
-            if new_interval >= self._speed_ramp_config.min_tick_interval:
-                self._current_tick_interval = new_interval
-                logger.info(
-                    "Speed ramped: tick_interval %.3f -> %.3f (frame %d)",
-                    self._current_tick_interval + self._speed_ramp_config.ramp_step,
-                    self._current_tick_interval,
-                    self._state.frame,
-                )
-            else:
-                # Hit the speed cap
-                if self._current_tick_interval > self._speed_ramp_config.min_tick_interval:
-                    self._current_tick_interval = self._speed_ramp_config.min_tick_interval
-                    logger.info(
-                        "Speed cap reached: tick_interval %.3f (frame %d)",
-                        self._current_tick_interval,
-                        self._state.frame,
-                    )
-            self._frames_since_last_ramp = 0
-
-    def _sleep_until_next_frame(self, frame_start: float) -> None:
-        elapsed = time.perf_counter() - frame_start
-        remaining = self._current_tick_interval - elapsed
-        if remaining > 0:
-            time.sleep(remaining)
+        config = self._speed_ramp_config
+        assert config is not None
+        self._next_ramp_frame += config.ramp_interval
+
+        previous = self._current_tick_interval
+        if previous <= config.min_tick_interval:
+            return
+        current = previous - config.ramp_step
+        # Respect the minimum tick interval (max speed)
+        if current < config.min_tick_interval:
+            current = config.min_tick_interval
+            self._current_tick_interval = current
+            logger.info(
+                "Speed cap reached: tick_interval %.3f (frame %d)",
+                current,
+                self._state.frame,
+            )
+        else:
+            self._current_tick_interval = current
+            logger.info(
+                "Speed ramped: tick_interval %.3f -> %.3f (frame %d)",
+                previous,
+                current,
+                self._state.frame,
+            )
+
+    def _sleep_until_next_frame(self, frame_start: float) -> float:
+        """
+        Wait for the frame deadline using coarse sleeps, then spin for the tail.
+
+        A single ``time.sleep(remaining)`` routinely overshoots by a few
+        milliseconds, which is a large share of a 30ms frame. Short sleeps are
+        taken only while the time left exceeds the worst sleep seen recently;
+        the rest is busy-waited on ``perf_counter``. Returns the clock reading
+        taken when the wait ended.
+        """
+        interval = self._current_tick_interval
+        if interval <= 0:
+            # Unpaced (headless) runs never consult the clock again.
+            return frame_start
+        deadline = frame_start + interval
+        now = time.perf_counter()
+        while deadline - now > self._worst_sleep:
+            time.sleep(_SLEEP_QUANTUM)
+            after = time.perf_counter()
+            self._record_sleep(after - now)
+            now = after
+        while now < deadline:
+            now = time.perf_counter()
+        return now
+
+    def _record_sleep(self, duration: float) -> None:
+        index = self._sleep_sample_index
+        evicted = self._sleep_samples[index]
+        self._sleep_samples[index] = duration
+        self._sleep_sample_index = (index + 1) & (_SLEEP_SAMPLES - 1)
+        if duration >= self._worst_sleep:
+            self._worst_sleep = duration
+        elif evicted == self._worst_sleep:
+            # Only rescan when the sample that held the maximum falls out of the ring.
+            self._worst_sleep = max(self._sleep_samples)
 
 
 class GameRunner:
@@ -560,7 +733,10 @@ class GameRunner:
         if renderer is None:
             renderer = AnsiRenderer(display_config, debug_config)
 
-        self._profiles = {profile.id: profile for profile in profiles}
+        # Built once and frozen: the loop hands this same mapping to the renderer every frame.
+        self._profiles: Mapping[int, SnakeProfile] = MappingProxyType(
+            {profile.id: profile for profile in profiles}
+        )
         self._renderer = renderer
         self._input = input_provider or InputProvider()
         if rng is not None:
@@ -593,6 +769,7 @@ class GameRunner:
             decision_provider=ai_controller,
             input_provider=self._input,
             overrides=controller_overrides,
+            history_capacity=state_history_capacity,
         )
 
         self._loop = GameLoop(
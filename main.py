@@ -7,7 +7,7 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from config import (
     AIConfig,
@@ -27,6 +27,8 @@ from factories import AIControllerFactory, RendererFactory
 from game import GameRunner, KeyboardInput, SnakeProfile
 from models import Direction
 
+logger = logging.getLogger("nyasnake")
+
 
 def setup_logging(log_level: str) -> None:
     logging.basicConfig(
@@ -35,7 +37,7 @@ def setup_logging(log_level: str) -> None:
     )
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     default_debug = get_default_debug_config()
     default_game = get_default_game_config()
     parser = argparse.ArgumentParser(description="Nyasnake arena")
@@ -69,7 +71,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--ramp-step", type=float, default=0.01, help="Tick interval reduction per ramp in seconds (default: 0.01).")
     parser.add_argument("--min-tick", type=float, default=0.03, help="Minimum tick interval / maximum speed cap (default: 0.03).")
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def build_profiles(display_config: DisplayConfig) -> List[SnakeProfile]:
@@ -211,8 +213,9 @@ def build_game_options(args: argparse.Namespace) -> GameOptions:
     )
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the simulation; ``argv`` defaults to ``sys.argv[1:]``."""
+    args = parse_args(argv)
     setup_logging(args.log_level)
     
     # Build game options from CLI args (with preset support)
@@ -224,7 +227,6 @@ def main() -> None:
     ai_config = get_default_ai_config()
     debug_config = configure_debug(args.debug, args.log_level)
 
-    logger = logging.getLogger("nyasnake")
     logger.info("Starting Nyasnake")
 
     profiles = build_profiles(display_config)
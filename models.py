@@ -4,42 +4,34 @@ Core geometric primitives used by the Nyasnake engine and AI.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Iterable, Tuple
+from enum import IntEnum
+from typing import Final, Iterable, NamedTuple, Tuple
 
 
-class Direction(Enum):
-    """Cardinal directions with unit vector offsets."""
+class Direction(IntEnum):
+    """Cardinal directions; members double as indices into the offset tables below."""
 
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
 
     def opposite(self) -> "Direction":
-        mapping = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }
-        return mapping[self]
+        return _OPPOSITES[self]
 
     @property
     def delta(self) -> Tuple[int, int]:
-        return self.value
+        return _DELTAS[self]
 
 
-@dataclass(frozen=True)
-class Position:
+class Position(NamedTuple):
     """Immutable 2D grid position."""
 
     x: int
     y: int
 
-    def __add__(self, direction: Direction) -> "Position":
-        dx, dy = direction.delta
+    def __add__(self, direction: Direction) -> "Position":  # type: ignore[override]
+        dx, dy = _DELTAS[direction]
         return Position(self.x + dx, self.y + dy)
 
     def distance_to(self, other: "Position") -> int:
@@ -47,8 +39,19 @@ class Position:
         return abs(self.x - other.x) + abs(self.y - other.y)
 
     def neighbors(self) -> Iterable["Position"]:
-        for direction in Direction:
+        for direction in _DIRECTIONS:
             yield self + direction
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
+
+# Indexed by Direction.
+_OPPOSITES: Final[Tuple[Direction, ...]] = (
+    Direction.DOWN,
+    Direction.UP,
+    Direction.RIGHT,
+    Direction.LEFT,
+)
+
+# Iteration order of Direction, frozen once so hot loops avoid EnumMeta.__iter__.
+_DIRECTIONS: Final[Tuple[Direction, ...]] = tuple(Direction)
+# (dx, dy) offsets indexed by Direction, for loops that work on raw coordinates.
+_DELTAS: Final[Tuple[Tuple[int, int], ...]] = ((0, -1), (0, 1), (-1, 0), (1, 0))
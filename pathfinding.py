@@ -5,10 +5,14 @@ Lightweight pathfinding utilities operating on immutable game state snapshots.
 from __future__ import annotations
 
 import heapq
-from typing import Dict, List, Optional, Set, Tuple
+from array import array
+from typing import Final, List, Optional
 
-from engine import GameState
-from models import Direction, Position
+from engine import _WALL, GameState
+from models import _DELTAS, Position
+
+# g-score sentinel for cells that have not been reached yet.
+_UNREACHED: Final = 2**30
 
 
 def find_path(
@@ -24,71 +28,122 @@ def find_path(
     if start == goal:
         return []
 
-    open_heap: List[Tuple[int, int, int, Position]] = []
+    width = state.width
+    height = state.height
+    if not (0 <= start.x < width and 0 <= start.y < height):
+        return None
+    # Off-board goals must be rejected before packing: (width, y) packs to the same key as
+    # the on-board cell (0, y + 1).
+    if not state.is_within_bounds(goal):
+        return None
+
+    # Results are memoised on the state itself, so they live exactly as long as the
+    # snapshot they were computed for and need no explicit invalidation.
+    memo = state.path_cache()
+    memo_key = (snake_id, start, goal)
+    if memo_key in memo:
+        cached = memo[memo_key]
+        return None if cached is None else list(cached)
+
+    own = state.find_snake(snake_id)
+    own_tail_key = -1
+    if own is not None and own.body:
+        tail = own.body[-1]
+        own_tail_key = tail.y * width + tail.x
+
+    keys = _astar_core(
+        width,
+        height,
+        start.y * width + start.x,
+        goal.y * width + goal.x,
+        state.occupancy_grid(),
+        own_tail_key,
+    )
+    if keys is None:
+        memo[memo_key] = None
+        return None
+    path = tuple(Position(key % width, key // width) for key in keys)
+    memo[memo_key] = path
+    return list(path)
+
+
+def _astar_core(
+    width: int,
+    height: int,
+    start_key: int,
+    goal_key: int,
+    blocked: bytes,
+    own_tail_key: int,
+) -> Optional[List[int]]:
+    """
+    A* over packed ``y * width + x`` cell keys.
+
+    Works purely on ints and flat buffers so it has no dependency on the
+    engine types. Blocked cells are impassable unless they are the goal or
+    the requesting snake's own tail. ``blocked`` must be walled in as built by
+    ``GameState.occupancy_grid``, so neighbours need no bounds checks: stepping off any edge
+    (including below key 0, via negative indexing) lands on a wall. Returns the keys
+    after ``start_key`` up to and including ``goal_key``, or None when the goal is
+    unreachable.
+    """
+    goal_y, goal_x = divmod(goal_key, width)
+    start_y, start_x = divmod(start_key, width)
+    size = width * height
+
+    # Heap entries are single ints packing (priority, push order, key), most significant
+    # first, so heapq compares plain ints and equal priorities still pop in FIFO order.
+    # Each cell is pushed at most once per incoming edge, which bounds the counter.
+    key_bits = size.bit_length()
+    order_shift = key_bits
+    priority_shift = key_bits + (4 * size).bit_length()
+    key_mask = (1 << key_bits) - 1
+    open_heap: List[int] = [
+        ((abs(start_x - goal_x) + abs(start_y - goal_y)) << priority_shift) | start_key
+    ]
     counter = 0
-    heapq.heappush(open_heap, (_heuristic(start, goal), counter, 0, start))
 
-    came_from: Dict[Position, Position] = {}
-    g_score: Dict[Position, int] = {start: 0}
-    visited: Set[Position] = set()
+    # Parent links and g-scores live in flat per-cell arrays indexed by key.
+    came_from = array("i", [-1]) * size
+    g_score = array("i", [_UNREACHED]) * size
+    g_score[start_key] = 0
+    visited = bytearray(size)
+    steps = tuple((dy * width + dx, dx, dy) for dx, dy in _DELTAS)
 
     while open_heap:
-        _, _, distance, current = heapq.heappop(open_heap)
-        if current in visited:
+        current = heapq.heappop(open_heap) & key_mask
+        if visited[current]:
             continue
-        visited.add(current)
-
-        if current == goal:
-            return _reconstruct_path(came_from, current)
-
-        for neighbor in _neighbors(state, snake_id, current, goal):
-            tentative = distance + 1
-            if tentative < g_score.get(neighbor, float("inf")):
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative
-                priority = tentative + _heuristic(neighbor, goal)
-                counter += 1
-                heapq.heappush(open_heap, (priority, counter, tentative, neighbor))
+        visited[current] = 1
+        # The first pop of a cell carries its lowest priority, hence its final g-score.
+        distance = g_score[current]
+
+        if current == goal_key:
+            return _reconstruct_path(came_from, current, distance)
+
+        tentative = distance + 1
+        y, x = divmod(current, width)
+        for step, dx, dy in steps:
+            neighbor = current + step
+            cell = blocked[neighbor]
+            if cell and (cell == _WALL or (neighbor != goal_key and neighbor != own_tail_key)):
+                continue
+            if visited[neighbor] or tentative >= g_score[neighbor]:
+                continue
+            came_from[neighbor] = current
+            g_score[neighbor] = tentative
+            priority = tentative + abs(x + dx - goal_x) + abs(y + dy - goal_y)
+            counter += 1
+            heapq.heappush(
+                open_heap, (priority << priority_shift) | (counter << order_shift) | neighbor
+            )
 
     return None
 
 
-def _heuristic(pos: Position, goal: Position) -> int:
-    return pos.distance_to(goal)
-
-
-def _neighbors(
-    state: GameState, snake_id: int, pos: Position, goal: Position
-) -> List[Position]:
-    neighbors = []
-    for direction in Direction:
-        candidate = pos + direction
-        if not state.is_within_bounds(candidate):
-            continue
-        if _is_walkable(state, snake_id, candidate, goal):
-            neighbors.append(candidate)
-    return neighbors
-
-
-def _is_walkable(
-    state: GameState, snake_id: int, pos: Position, goal: Position
-) -> bool:
-    if pos == goal:
-        return True
-    occupant = state.occupied.get(pos)
-    if occupant is None:
-        return True
-    if occupant == snake_id:
-        snake = state.find_snake(snake_id)
-        if snake and snake.body and pos == snake.body[-1]:
-            return True
-    return False
-
-
-def _reconstruct_path(came_from: Dict[Position, Position], current: Position) -> List[Position]:
-    path = []
-    while current in came_from:
-        path.append(current)
+def _reconstruct_path(came_from: array, current: int, length: int) -> List[int]:
+    """Walk the parent chain once, filling a list sized from the goal's g-score."""
+    path = [0] * length
+    for index in range(length - 1, -1, -1):
+        path[index] = current
         current = came_from[current]
-    path.reverse()
     return path
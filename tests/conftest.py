@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
+from typing import Mapping
 
 import pytest
 
@@ -12,24 +14,48 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from config import AIConfig, AIPersonality, DisplayConfig
 from engine import GameState, SnakeState
+from factories import AIControllerFactory
+from game import SnakeProfile
 from models import Position
 
 
-@pytest.fixture
+@lru_cache(maxsize=None)
+def _position(x: int, y: int) -> Position:
+    """Canonical Position for a coordinate, shared by every test snake."""
+    return Position(x, y)
+
+
+_EMPTY_FOOD: frozenset = frozenset()
+
+
+@lru_cache(maxsize=None)
+def _food(*positions: Position) -> frozenset[Position]:
+    """Food set for a layout; equal layouts share one frozenset."""
+    return frozenset(positions) if positions else _EMPTY_FOOD
+
+
+@lru_cache(maxsize=256)
+def _occupancy(snakes: tuple[SnakeState, ...]) -> Mapping[Position, int]:
+    """
+    Occupancy map for a snake layout. Equal layouts share one map across the session, so
+    it is handed out read-only: a test writing to ``state.occupied`` fails loudly instead
+    of leaking into other tests' states.
+    """
+    owners = [(snake.id, snake.body) for snake in snakes if snake.alive]
+    return MappingProxyType({segment: snake_id for snake_id, body in owners for segment in body})
+
+
+@pytest.fixture(scope="session")
 def make_state():
     """Create a GameState for testing with configurable parameters."""
     def _make(snakes, food=None, width=12, height=12, frame=0):
-        occupied = {
-            segment: snake.id
-            for snake in snakes
-            if snake.alive
-            for segment in snake.body
-        }
+        snakes = tuple(snakes)
         return GameState(
-            snakes=tuple(snakes),
-            food=frozenset(food or set()),
-            occupied=MappingProxyType(occupied),
+            snakes=snakes,
+            food=_EMPTY_FOOD if food is None else _food(*food),
+            occupied=_occupancy(snakes),
             width=width,
             height=height,
             frame=frame,
@@ -37,7 +63,7 @@ def make_state():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def snake():
     """Helper fixture to create a SnakeState for testing."""
     def _snake(id_: int, *segments: tuple[int, int], direction=None) -> SnakeState:
@@ -46,6 +72,33 @@ def snake():
         if direction is None:
             direction = Direction.RIGHT
         
-        body = tuple(Position(x, y) for x, y in segments)
+        body = tuple(_position(x, y) for x, y in segments)
         return SnakeState(id=id_, body=body, direction=direction)
     return _snake
+
+
+@pytest.fixture(scope="session")
+def ai_config() -> AIConfig:
+    return AIConfig()
+
+
+@pytest.fixture(scope="session")
+def display_config() -> DisplayConfig:
+    return DisplayConfig()
+
+
+@pytest.fixture(scope="session")
+def ai_factory(ai_config: AIConfig) -> AIControllerFactory:
+    """Stateless after construction, so one factory serves every runner test."""
+    return AIControllerFactory(ai_config)
+
+
+@pytest.fixture(scope="session")
+def profiles(display_config: DisplayConfig) -> tuple[SnakeProfile, ...]:
+    """The standard three-snake roster (frozen profiles in an immutable tuple)."""
+    colors = display_config.COLORS
+    return (
+        SnakeProfile(id=0, personality=AIPersonality.AGGRESSIVE, color=colors["red"], symbol="A"),
+        SnakeProfile(id=1, personality=AIPersonality.DEFENSIVE, color=colors["green"], symbol="B"),
+        SnakeProfile(id=2, personality=AIPersonality.BALANCED, color=colors["blue"], symbol="C"),
+    )
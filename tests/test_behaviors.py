@@ -4,105 +4,79 @@ Behaviour-focused tests for the GreedyAIController with personality strategies.
 
 from __future__ import annotations
 
+import pytest
+
 from ai import GreedyAIController, SnakeStrategy, StrategyFactory
 from config import AIConfig, AIPersonality
 from engine import SnakeState
 from models import Direction, Position
 
 
+_STRATEGIES = {personality: SnakeStrategy(personality) for personality in AIPersonality}
+_STRATEGY_FACTORY = StrategyFactory()
+
+
 def build_controller(
     snakes: list[SnakeState],
     strategies: dict[int, SnakeStrategy] | None = None,
     ai_config: AIConfig | None = None,
 ) -> GreedyAIController:
-    descriptor = strategies or {
-        snake.id: SnakeStrategy(AIPersonality.BALANCED) for snake in snakes
-    }
-    return GreedyAIController(descriptor, ai_config or AIConfig(), StrategyFactory())
+    balanced = _STRATEGIES[AIPersonality.BALANCED]
+    descriptor = strategies or {snake.id: balanced for snake in snakes}
+    return GreedyAIController(descriptor, ai_config or AIConfig(), _STRATEGY_FACTORY)
+
+
+@pytest.fixture(scope="module")
+def trapped_scenario(make_state, snake):
+    """Snake 0 boxed in by its own body and snake 1; immutable, so shared per module."""
+    player = snake(0, (3, 3), (3, 4), (2, 3), (2, 4))
+    walls = snake(1, (4, 3), (4, 2), (3, 2), (2, 2), direction=Direction.LEFT)
+    return make_state([player, walls]), build_controller([player, walls])
 
 
 class TestGreedyAIController:
-    def test_moves_toward_nearest_food(self, make_state) -> None:
-        snake = SnakeState(
-            id=0,
-            body=(Position(4, 4),),
-            direction=Direction.RIGHT,
-        )
-        state = make_state([snake], {Position(7, 4)})
-        controller = build_controller([snake])
+    def test_moves_toward_nearest_food(self, make_state, snake) -> None:
+        player = snake(0, (4, 4))
+        state = make_state([player], {Position(7, 4)})
+        controller = build_controller([player])
 
         decisions = controller.decide(state)
 
         assert decisions[0] == Direction.RIGHT
 
-    def test_avoids_walls(self, make_state) -> None:
-        snake = SnakeState(
-            id=0,
-            body=(Position(5, 1),),
-            direction=Direction.UP,
-        )
-        state = make_state([snake], {Position(5, 0)})
-        controller = build_controller([snake])
+    def test_avoids_walls(self, make_state, snake) -> None:
+        player = snake(0, (5, 1), direction=Direction.UP)
+        state = make_state([player], {Position(5, 0)})
+        controller = build_controller([player])
 
         decisions = controller.decide(state)
 
         assert decisions[0] != Direction.UP
 
-    def test_prefers_open_space_without_food(self, make_state) -> None:
-        snake = SnakeState(
-            id=0,
-            body=(Position(5, 5),),
-            direction=Direction.RIGHT,
-        )
-        blocker = SnakeState(
-            id=1,
-            body=(
-                Position(6, 5),
-                Position(7, 5),
-                Position(7, 6),
-            ),
-            direction=Direction.LEFT,
-        )
-        state = make_state([snake, blocker])
-        controller = build_controller([snake, blocker])
+    def test_prefers_open_space_without_food(self, make_state, snake) -> None:
+        player = snake(0, (5, 5))
+        blocker = snake(1, (6, 5), (7, 5), (7, 6), direction=Direction.LEFT)
+        state = make_state([player, blocker])
+        controller = build_controller([player, blocker])
 
         decisions = controller.decide(state)
 
         assert decisions[0] in {Direction.UP, Direction.DOWN, Direction.LEFT}
 
-    def test_handles_no_safe_moves(self, make_state) -> None:
-        snake = SnakeState(
-            id=0,
-            body=(Position(3, 3), Position(3, 4), Position(2, 3), Position(2, 4)),
-            direction=Direction.RIGHT,
-        )
-        walls = SnakeState(
-            id=1,
-            body=(Position(4, 3), Position(4, 2), Position(3, 2), Position(2, 2)),
-            direction=Direction.LEFT,
-        )
-        state = make_state([snake, walls])
-        controller = build_controller([snake, walls])
+    def test_handles_no_safe_moves(self, trapped_scenario) -> None:
+        state, controller = trapped_scenario
 
         decisions = controller.decide(state)
 
         assert decisions[0] in Direction
 
-    def test_aggressive_targets_opponent(self, make_state) -> None:
-        aggressive = SnakeState(
-            id=0,
-            body=(Position(2, 2),),
-            direction=Direction.RIGHT,
-        )
-        rival = SnakeState(
-            id=1,
-            body=(Position(5, 2), Position(6, 2)),
-            direction=Direction.LEFT,
-        )
+    def test_aggressive_targets_opponent(self, make_state, snake) -> None:
+        aggressive = snake(0, (2, 2))
+        rival = snake(1, (5, 2), (6, 2), direction=Direction.LEFT)
         state = make_state([aggressive, rival], {Position(2, 1)})
         strategies = {
-            0: SnakeStrategy(AIPersonality.AGGRESSIVE),
-            1: SnakeStrategy(AIPersonality.DEFENSIVE),
+            0: _STRATEGIES[AIPersonality.AGGRESSIVE],
+            1: _STRATEGIES[AIPersonality.DEFENSIVE],
         }
         controller = build_controller([aggressive, rival], strategies)
 
@@ -110,21 +84,13 @@ class TestGreedyAIController:
 
         assert decisions[0] == Direction.RIGHT
 
-    def test_defensive_prefers_space_over_food(self, make_state) -> None:
-        defender = SnakeState(
-            id=0,
-            body=(Position(4, 4),),
-            direction=Direction.RIGHT,
-        )
-        rival = SnakeState(
-            id=1,
-            body=(Position(4, 2),),
-            direction=Direction.DOWN,
-        )
+    def test_defensive_prefers_space_over_food(self, make_state, snake) -> None:
+        defender = snake(0, (4, 4))
+        rival = snake(1, (4, 2), direction=Direction.DOWN)
         state = make_state([defender, rival], {Position(4, 3)})
         strategies = {
-            0: SnakeStrategy(AIPersonality.DEFENSIVE),
-            1: SnakeStrategy(AIPersonality.AGGRESSIVE),
+            0: _STRATEGIES[AIPersonality.DEFENSIVE],
+            1: _STRATEGIES[AIPersonality.AGGRESSIVE],
         }
         controller = build_controller([defender, rival], strategies)
 
@@ -132,15 +98,11 @@ class TestGreedyAIController:
 
         assert decisions[0] == Direction.DOWN
 
-    def test_balanced_respects_max_path_length(self, make_state) -> None:
-        snake = SnakeState(
-            id=0,
-            body=(Position(1, 1),),
-            direction=Direction.RIGHT,
-        )
-        state = make_state([snake], {Position(4, 1)}, width=10, height=10)
+    def test_balanced_respects_max_path_length(self, make_state, snake) -> None:
+        player = snake(0, (1, 1))
+        state = make_state([player], {Position(4, 1)}, width=10, height=10)
         controller = build_controller(
-            [snake],
+            [player],
             ai_config=AIConfig(MAX_PATH_LENGTH=0),
         )
 
@@ -148,21 +110,13 @@ class TestGreedyAIController:
 
         assert decisions[0] == Direction.DOWN
 
-    def test_aggressive_falls_back_when_paths_exceed_limit(self, make_state) -> None:
-        hunter = SnakeState(
-            id=0,
-            body=(Position(1, 1),),
-            direction=Direction.RIGHT,
-        )
-        rival = SnakeState(
-            id=1,
-            body=(Position(6, 1),),
-            direction=Direction.LEFT,
-        )
+    def test_aggressive_falls_back_when_paths_exceed_limit(self, make_state, snake) -> None:
+        hunter = snake(0, (1, 1))
+        rival = snake(1, (6, 1), direction=Direction.LEFT)
         state = make_state([hunter, rival], width=10, height=10)
         strategies = {
-            0: SnakeStrategy(AIPersonality.AGGRESSIVE),
-            1: SnakeStrategy(AIPersonality.DEFENSIVE),
+            0: _STRATEGIES[AIPersonality.AGGRESSIVE],
+            1: _STRATEGIES[AIPersonality.DEFENSIVE],
         }
         controller = build_controller(
             [hunter, rival],
@@ -4,8 +4,6 @@ Smoke tests for the CLI entry point to ensure wiring stays intact.
 
 from __future__ import annotations
 
-import logging
-
 import pytest
 
 import main
@@ -28,43 +26,53 @@ def stub_state(make_state):
     )
 
 
-def test_main_wires_factories(monkeypatch, capsys, stub_state):
-    recorded = {}
+class StubRunner:
+    """Stand-in for GameRunner that records its wiring instead of running a game."""
+
+    recorded: dict = {}
+    stub_state = None
+
+    def __init__(self, profiles, *_, **kwargs):  # type: ignore[override]
+        type(self).recorded["kwargs"] = kwargs
+        self._profiles = {profile.id: profile for profile in profiles}
+        self._seed = kwargs.get("seed")
+        self._state = type(self).stub_state
 
-    class StubRunner:
-        def __init__(self, profiles, *_, **kwargs):  # type: ignore[override]
-            recorded["kwargs"] = kwargs
-            self._profiles = {profile.id: profile for profile in profiles}
-            self._seed = kwargs.get("seed")
-            self._state = stub_state
+    def run(self) -> None:
+        pass
 
-        def run(self) -> None:
-            pass
+    @property
+    def state(self):
+        return self._state
 
-        @property
-        def state(self):
-            return self._state
+    @property
+    def profiles(self):
+        return self._profiles
 
-        @property
-        def profiles(self):
-            return self._profiles
+    @property
+    def seed(self):
+        return self._seed
 
-        @property
-        def seed(self):
-            return self._seed
 
+@pytest.fixture
+def stub_runner(monkeypatch, stub_state):
+    monkeypatch.setattr(StubRunner, "recorded", {})
+    monkeypatch.setattr(StubRunner, "stub_state", stub_state)
     monkeypatch.setattr(main, "GameRunner", StubRunner)
-    monkeypatch.setattr(main, "setup_logging", lambda level: logging.getLogger("test").setLevel(level))
+    return StubRunner
+
+
+def test_main_wires_factories(monkeypatch, capsys, stub_runner):
+    monkeypatch.setattr(main, "setup_logging", lambda level: None)
     monkeypatch.setattr(main, "create_input_provider", lambda interactive: None)
-    monkeypatch.setattr(main.sys, "argv", ["nyasnake", "--seed", "7", "--tick-rate", "2", "--ai-level", "hard"])
 
-    main.main()
+    main.main(argv=["--seed", "7", "--tick-rate", "2", "--ai-level", "hard"])
 
     output = capsys.readouterr().out
     assert "Nyasnake Arena" in output
     assert "Winner" in output
 
-    kwargs = recorded["kwargs"]
+    kwargs = stub_runner.recorded["kwargs"]
     controller = kwargs["ai_controller"]
     assert isinstance(controller, GreedyAIController)
     renderer = kwargs["renderer"]
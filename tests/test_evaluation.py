@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from random import Random
 
-from engine import GameState, SnakeState, advance_state
+import pytest
+
+from engine import GameState, SnakeSpawn, SnakeState, advance_state, create_initial_state
 from models import Direction, Position
 
 
@@ -69,6 +71,35 @@ class TestAdvanceState:
         assert not snakes[1].alive
         assert snakes[0].kills == 1
 
+    def test_occupancy_follows_moves_growth_and_deaths(self, make_state) -> None:
+        winner = SnakeState(
+            id=0,
+            body=(Position(4, 4), Position(3, 4), Position(2, 4)),
+            direction=Direction.RIGHT,
+        )
+        loser = SnakeState(
+            id=1,
+            body=(Position(6, 4), Position(7, 4)),
+            direction=Direction.LEFT,
+        )
+        eater = SnakeState(
+            id=2,
+            body=(Position(8, 8), Position(8, 9)),
+            direction=Direction.UP,
+        )
+        state = make_state([winner, loser, eater], {Position(8, 7)})
+
+        result = advance_state(state, {}, Random(0), desired_food=0)
+
+        assert result.state.occupied == {
+            Position(5, 4): 0,
+            Position(4, 4): 0,
+            Position(3, 4): 0,
+            Position(8, 7): 2,
+            Position(8, 8): 2,
+            Position(8, 9): 2,
+        }
+
     def test_equal_length_head_to_head_eliminates_both(self, make_state) -> None:
         snake_a = SnakeState(
             id=0,
@@ -110,3 +141,54 @@ class TestAdvanceState:
         assert len(result.state.food) == 3
         updated = next(s for s in result.state.snakes if s.id == 0)
         assert updated.score == 10
+
+    def test_food_respawn_fills_crowded_board_without_overlap(self, make_state) -> None:
+        snake = SnakeState(
+            id=0,
+            body=(Position(1, 1),),
+            direction=Direction.DOWN,
+        )
+        foods = {Position(1, 2), Position(2, 1), Position(3, 1), Position(2, 2)}
+        state = make_state([snake], foods, width=5, height=4)
+        rng = Random(7)
+
+        result = advance_state(state, {0: Direction.DOWN}, rng, desired_food=5)
+
+        # Only one interior cell is left free, so the request is capped rather than overlapping.
+        assert result.state.food == {
+            Position(2, 1),
+            Position(3, 1),
+            Position(2, 2),
+            Position(3, 2),
+        }
+
+
+
+class TestCreateInitialState:
+    @pytest.mark.parametrize("segment", [Position(12, 12), Position(7, 1), Position(2, -4)])
+    def test_off_board_spawn_segments_do_not_block_food(self, segment) -> None:
+        # Each segment packs to an index past the 5x5 board or onto an interior cell.
+        spawn = SnakeSpawn(id=0, body=(segment,), direction=Direction.RIGHT)
+
+        state = create_initial_state(5, 5, [spawn], 9, Random(5))
+
+        assert state.food == {Position(x, y) for x in range(1, 4) for y in range(1, 4)}
+
+
+class TestDerivedData:
+    def test_body_keys_pack_segments_and_rebuild_after_release(self, make_state) -> None:
+        snake = SnakeState(
+            id=0,
+            body=(Position(3, 2), Position(2, 2)),
+            direction=Direction.RIGHT,
+        )
+        state = make_state([snake], width=10)
+
+        keys = state.body_keys(0)
+        assert keys == {23, 22}
+        assert state.body_keys(0) is keys
+        assert state.body_keys(9) == frozenset()
+
+        state.release_caches()
+        assert state.body_keys(0) == keys
+        assert state.body_keys(0) is not keys
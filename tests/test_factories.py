@@ -12,19 +12,17 @@ from factories import AIControllerFactory, RendererFactory
 from game import AnsiRenderer, SnakeProfile
 
 
-def make_profiles(display: DisplayConfig) -> list[SnakeProfile]:
-    colors = display.COLORS
-    return [
-        SnakeProfile(id=0, personality=AIPersonality.BALANCED, color=colors["red"], symbol="A"),
-        SnakeProfile(id=1, personality=AIPersonality.DEFENSIVE, color=colors["green"], symbol="B"),
-        SnakeProfile(id=2, personality=AIPersonality.AGGRESSIVE, color=colors["blue"], symbol="C"),
-    ]
+_COLORS = DisplayConfig.COLORS
+_PROFILES: tuple[SnakeProfile, ...] = (
+    SnakeProfile(id=0, personality=AIPersonality.BALANCED, color=_COLORS["red"], symbol="A"),
+    SnakeProfile(id=1, personality=AIPersonality.DEFENSIVE, color=_COLORS["green"], symbol="B"),
+    SnakeProfile(id=2, personality=AIPersonality.AGGRESSIVE, color=_COLORS["blue"], symbol="C"),
+)
 
 
 @pytest.mark.parametrize("level", ["easy", "normal", "hard"])
 def test_ai_controller_factory_assigns_personalities(level: str) -> None:
-    display = DisplayConfig()
-    profiles = make_profiles(display)
+    profiles = _PROFILES
     factory = AIControllerFactory(AIConfig())
 
     controller = factory.create(level, profiles)
@@ -6,17 +6,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from random import Random
+from types import MappingProxyType
 from typing import Dict, Mapping, Optional, Sequence
 
 import pytest
 
+import game
+from config import DebugConfig
 from game import (
+    _SLEEP_QUANTUM,
+    _SLEEP_SAMPLES,
     DecisionCollector,
     EventDispatcher,
     GameEventVisitor,
+    GameLoop,
     InputCommand,
     InputProvider,
     MoveCommand,
+    Renderer,
     SnakeController,
     StateHistory,
 )
@@ -28,8 +35,10 @@ class _StaticDecisionProvider:
     def __init__(self, decisions: Mapping[int, Direction]):
         self._decisions = dict(decisions)
 
-    def decide(self, state) -> Mapping[int, Direction]:  # type: ignore[override]
-        return dict(self._decisions)
+    def decide(self, state, snake_ids=None) -> Mapping[int, Direction]:  # type: ignore[override]
+        if snake_ids is not None:
+            return {sid: move for sid, move in self._decisions.items() if sid in snake_ids}
+        return MappingProxyType(self._decisions)
 
 
 class _StaticInput(InputProvider):
@@ -42,7 +51,7 @@ class _StaticInput(InputProvider):
 
 @dataclass
 class _FixedController(SnakeController):
-    direction: Direction
+    direction: Optional[Direction]
 
     def decide(self, state, snake) -> Optional[Direction]:  # type: ignore[override]
         return self.direction
@@ -87,6 +96,44 @@ def test_decision_collector_updates_and_removes_overrides(make_state, snake) ->
     assert len(collector.history()) == 2
 
 
+def test_decision_collector_skips_overridden_snakes_in_provider(make_state, snake) -> None:
+    requested: list = []
+
+    class _RecordingProvider(_StaticDecisionProvider):
+        def decide(self, state, snake_ids=None) -> Mapping[int, Direction]:  # type: ignore[override]
+            requested.append(snake_ids)
+            return super().decide(state, snake_ids)
+
+    state = make_state([snake(0, (3, 3)), snake(1, (5, 5)), snake(2, (7, 7))])
+    collector = DecisionCollector(
+        decision_provider=_RecordingProvider({0: Direction.UP, 1: Direction.UP, 2: Direction.UP}),
+        input_provider=None,
+        overrides={0: _FixedController(Direction.LEFT), 1: _FixedController(None)},
+    )
+
+    decisions = collector.collect(state)
+
+    # Snake 1's controller abstained, so the provider still plans for it.
+    assert requested == [frozenset({1, 2})]
+    assert decisions == {0: Direction.LEFT, 1: Direction.UP, 2: Direction.UP}
+
+
+def test_decision_collector_bounds_command_history(make_state, snake) -> None:
+    state = make_state([snake(0, (3, 3))])
+    collector = DecisionCollector(
+        decision_provider=_StaticDecisionProvider({0: Direction.UP}),
+        input_provider=_StaticInput([MoveCommand(0, Direction.LEFT)]),
+        history_capacity=2,
+    )
+
+    for _ in range(3):
+        collector.collect(state)
+
+    history = collector.history()
+    assert len(history) == 2
+    assert all(isinstance(batch, tuple) for batch in history)
+
+
 def test_state_history_tracks_capacity_and_rewind(make_state, snake) -> None:
     history = StateHistory(capacity=2)
     states = [
@@ -127,3 +174,146 @@ def test_event_dispatcher_notifies_visitors_and_listeners(make_state, snake) ->
 
     assert ticks_captured == [tick]
     assert events_captured == list(events)
+
+
+def test_event_dispatcher_isolates_failing_listeners(make_state, snake) -> None:
+    first: list[TickResult] = []
+    last: list[TickResult] = []
+
+    def failing(tick: TickResult) -> None:
+        raise RuntimeError("listener failure")
+
+    dispatcher = EventDispatcher()
+    dispatcher.register_listener(first.append)
+    dispatcher.register_listener(failing)
+    dispatcher.register_listener(last.append)
+
+    tick = TickResult(state=make_state([snake(0, (3, 3))]), events=())
+    dispatcher.dispatch(tick)
+
+    assert first == [tick]
+    assert last == [tick]
+
+
+def test_event_dispatcher_prefers_typed_handlers(make_state, snake) -> None:
+    deaths: list[GameEvent] = []
+    others: list[GameEvent] = []
+
+    class DeathVisitor:
+        def on_snake_died(self, event: GameEvent) -> None:
+            deaths.append(event)
+
+        def visit(self, event: GameEvent) -> None:
+            others.append(event)
+
+    dispatcher = EventDispatcher()
+    dispatcher.register_visitor(DeathVisitor())
+
+    state = make_state([snake(0, (3, 3))])
+    eaten = GameEvent(type="food_consumed", snake_id=0)
+    died = GameEvent(type="snake_died", snake_id=1)
+    dispatcher.dispatch(TickResult(state=state, events=(eaten, died)))
+
+    assert deaths == [died]
+    assert others == [eaten]
+
+
+class _FakeClock:
+    """Deterministic stand-in for time.perf_counter / time.sleep."""
+
+    def __init__(self, read_cost: float = 0.0, overshoot: float = 0.0) -> None:
+        self.now = 0.0
+        self.read_cost = read_cost
+        self.overshoot = overshoot
+        self.reads = 0
+        self.sleeps = 0
+
+    def perf_counter(self) -> float:
+        self.reads += 1
+        value = self.now
+        self.now += self.read_cost
+        return value
+
+    def sleep(self, duration: float) -> None:
+        self.sleeps += 1
+        self.now += duration + self.overshoot
+
+
+def _pacing_loop(make_state, snake, display_config, tick_interval: float) -> GameLoop:
+    return GameLoop(
+        renderer=Renderer(display_config, DebugConfig()),
+        decision_collector=DecisionCollector(_StaticDecisionProvider({}), None),
+        event_dispatcher=EventDispatcher(),
+        history=StateHistory(),
+        rng=Random(0),
+        desired_food=0,
+        tick_interval=tick_interval,
+        max_rounds=1,
+        profiles={},
+        initial_state=make_state([snake(0, (3, 3))]),
+    )
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(game.time, "perf_counter", clock.perf_counter)
+    monkeypatch.setattr(game.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_game_loop_unpaced_frames_skip_the_clock(
+    make_state, snake, display_config, fake_clock
+) -> None:
+    loop = _pacing_loop(make_state, snake, display_config, tick_interval=0.0)
+
+    assert loop._sleep_until_next_frame(5.0) == 5.0
+    assert fake_clock.reads == 0
+    assert fake_clock.sleeps == 0
+
+
+def test_game_loop_sleeps_coarsely_then_spins_to_deadline(
+    make_state, snake, display_config, fake_clock
+) -> None:
+    fake_clock.read_cost = 0.0001
+    fake_clock.overshoot = 0.0005
+    loop = _pacing_loop(make_state, snake, display_config, tick_interval=0.02)
+
+    finished = loop._sleep_until_next_frame(0.0)
+
+    # Overshooting sleeps stop early; the spin then lands within one clock read.
+    assert 0.02 <= finished < 0.02 + fake_clock.read_cost * 2
+    assert 1 <= fake_clock.sleeps < 0.02 / _SLEEP_QUANTUM
+    assert loop._worst_sleep == pytest.approx(_SLEEP_QUANTUM + 0.0005 + 0.0001)
+
+
+def test_game_loop_spins_when_remaining_time_is_within_worst_sleep(
+    make_state, snake, display_config, fake_clock
+) -> None:
+    fake_clock.read_cost = 0.0001
+    loop = _pacing_loop(make_state, snake, display_config, tick_interval=0.0005)
+
+    finished = loop._sleep_until_next_frame(0.0)
+
+    assert fake_clock.sleeps == 0
+    assert 0.0005 <= finished < 0.0005 + fake_clock.read_cost * 2
+    assert fake_clock.reads > 2
+
+
+def test_game_loop_worst_sleep_rescans_when_maximum_is_evicted(
+    make_state, snake, display_config
+) -> None:
+    loop = _pacing_loop(make_state, snake, display_config, tick_interval=0.0)
+
+    loop._record_sleep(0.005)
+    assert loop._worst_sleep == 0.005
+    for _ in range(_SLEEP_SAMPLES - 1):
+        loop._record_sleep(0.002)
+    # The 0.005 sample is still in the ring.
+    assert loop._worst_sleep == 0.005
+
+    loop._record_sleep(0.002)
+    assert loop._worst_sleep == 0.002
+
+    loop._record_sleep(0.003)
+    assert loop._worst_sleep == 0.003
@@ -5,8 +5,7 @@ from typing import Mapping, Optional, Sequence
 
 import pytest
 
-from config import AIConfig, AIPersonality, DebugConfig, DisplayConfig, GameConfig, SpeedRampConfig
-from factories import AIControllerFactory
+from config import AIConfig, DebugConfig, DisplayConfig, GameConfig, SpeedRampConfig
 from game import (
     GameRunner,
     InputCommand,
@@ -14,7 +13,6 @@ from game import (
     MoveCommand,
     Renderer,
     SnakeController,
-    SnakeProfile,
 )
 from models import Direction
 
@@ -42,7 +40,9 @@ class StaticDecisionProvider:
     def __init__(self, decisions: Mapping[int, Direction]) -> None:
         self._decisions = dict(decisions)
 
-    def decide(self, state) -> Mapping[int, Direction]:  # type: ignore[override]
+    def decide(self, state, snake_ids=None) -> Mapping[int, Direction]:  # type: ignore[override]
+        if snake_ids is not None:
+            return {sid: move for sid, move in self._decisions.items() if sid in snake_ids}
         return dict(self._decisions)
 
 
@@ -56,20 +56,12 @@ class FixedController(SnakeController):
         return self.direction
 
 
-def build_profiles(display_config: DisplayConfig) -> list[SnakeProfile]:
-    return [
-        SnakeProfile(id=0, personality=AIPersonality.AGGRESSIVE, color=display_config.COLORS["red"], symbol="A"),
-        SnakeProfile(id=1, personality=AIPersonality.DEFENSIVE, color=display_config.COLORS["green"], symbol="B"),
-        SnakeProfile(id=2, personality=AIPersonality.BALANCED, color=display_config.COLORS["blue"], symbol="C"),
-    ]
-
-
 @pytest.fixture
 def configs() -> tuple[GameConfig, DisplayConfig, DebugConfig, AIConfig]:
     return GameConfig(MAX_ROUNDS=1), DisplayConfig(), DebugConfig(), AIConfig()
 
 
-def test_controller_override_supersedes_ai(configs):
+def test_controller_override_supersedes_ai(configs, profiles):
     game_config, display_config, debug_config, _ai_config = configs
     renderer = DummyRenderer(display_config, debug_config)
     input_provider = DummyInput()
@@ -77,7 +69,7 @@ def test_controller_override_supersedes_ai(configs):
     controller = FixedController(Direction.DOWN)
 
     runner = GameRunner(
-        profiles=build_profiles(display_config),
+        profiles=profiles,
         renderer=renderer,
         input_provider=input_provider,
         ai_controller=ai,
@@ -98,11 +90,9 @@ def test_controller_override_supersedes_ai(configs):
     assert controller.calls >= 1
 
 
-def test_event_listeners_receive_ticks(configs):
-    game_config, display_config, debug_config, ai_config = configs
+def test_event_listeners_receive_ticks(configs, ai_factory, profiles):
+    game_config, display_config, debug_config, _ai_config = configs
     renderer = DummyRenderer(display_config, debug_config)
-    ai_factory = AIControllerFactory(ai_config)
-    profiles = build_profiles(display_config)
     ai_controller = ai_factory.create("normal", profiles)
     captured = []
 
@@ -125,13 +115,37 @@ def test_event_listeners_receive_ticks(configs):
     assert renderer.calls >= 1
 
 
+def test_recorded_states_release_derived_caches(display_config, ai_factory, profiles):
+    game_config = GameConfig(MAX_ROUNDS=5)
+    runner = GameRunner(
+        profiles=profiles,
+        renderer=DummyRenderer(display_config, DebugConfig()),
+        input_provider=DummyInput(),
+        ai_controller=ai_factory.create("normal", profiles),
+        game_config=game_config,
+        display_config=display_config,
+        debug_config=DebugConfig(),
+        tick_interval=0.0,
+        rng=Random(0),
+    )
+
+    runner.run()
+
+    final = runner.state
+    snapshots = [memento.state for memento in runner.history.snapshots()]
+    assert len(snapshots) > 2
+    for state in snapshots:
+        if state is not final:
+            derived = state._derived
+            assert derived.occupancy_grid is None
+            assert not derived.paths and not derived.body_keys
+
+
 # Speed ramping tests
-def test_speed_ramp_disabled_by_default(configs):
+def test_speed_ramp_disabled_by_default(configs, ai_factory, profiles):
     """Test that speed ramping doesn't occur when not configured."""
-    game_config, display_config, debug_config, ai_config = configs
+    game_config, display_config, debug_config, _ai_config = configs
     renderer = DummyRenderer(display_config, debug_config)
-    ai_factory = AIControllerFactory(ai_config)
-    profiles = build_profiles(display_config)
     ai_controller = ai_factory.create("normal", profiles)
     
     initial_tick = 0.10
@@ -157,16 +171,12 @@ def test_speed_ramp_disabled_by_default(configs):
     assert runner._loop._current_tick_interval == initial_tick
 
 
-def test_speed_ramp_decreases_tick_interval():
+def test_speed_ramp_decreases_tick_interval(display_config, ai_factory, profiles):
     """Test that speed ramping reduces tick interval over time."""
     game_config = GameConfig(WIDTH=40, HEIGHT=20, MAX_ROUNDS=250)
-    display_config = DisplayConfig()
     debug_config = DebugConfig()
-    ai_config = AIConfig()
     
     renderer = DummyRenderer(display_config, debug_config)
-    ai_factory = AIControllerFactory(ai_config)
-    profiles = build_profiles(display_config)
     ai_controller = ai_factory.create("normal", profiles)
     
     initial_tick = 0.10
@@ -207,16 +217,12 @@ def test_speed_ramp_decreases_tick_interval():
     assert final_tick >= ramp_config.min_tick_interval
 
 
-def test_speed_ramp_respects_minimum():
+def test_speed_ramp_respects_minimum(display_config, ai_factory, profiles):
     """Test that speed ramping doesn't go below the minimum tick interval."""
     game_config = GameConfig(WIDTH=40, HEIGHT=20, MAX_ROUNDS=300)
-    display_config = DisplayConfig()
     debug_config = DebugConfig()
-    ai_config = AIConfig()
     
     renderer = DummyRenderer(display_config, debug_config)
-    ai_factory = AIControllerFactory(ai_config)
-    profiles = build_profiles(display_config)
     ai_controller = ai_factory.create("normal", profiles)
     
     initial_tick = 0.10
@@ -247,16 +253,12 @@ def test_speed_ramp_respects_minimum():
     assert runner._loop._current_tick_interval >= min_tick
 
 
-def test_speed_ramp_timing():
+def test_speed_ramp_timing(display_config, ai_factory, profiles):
     """Test that speed ramping occurs at the correct frame intervals."""
     game_config = GameConfig(WIDTH=40, HEIGHT=20, MAX_ROUNDS=120)
-    display_config = DisplayConfig()
     debug_config = DebugConfig()
-    ai_config = AIConfig()
     
     renderer = DummyRenderer(display_config, debug_config)
-    ai_factory = AIControllerFactory(ai_config)
-    profiles = build_profiles(display_config)
     ai_controller = ai_factory.create("normal", profiles)
     
     initial_tick = 0.10
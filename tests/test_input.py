@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import select
 import types
 
 import pytest
@@ -45,3 +46,28 @@ def test_keyboard_input_handles_fileno_errors(monkeypatch):
     keyboard = KeyboardInput({"w": (0, Direction.UP)})
 
     assert getattr(keyboard, "_fd") is None
+
+
+def test_keyboard_input_translates_bound_keys(monkeypatch):
+    class _ScriptedStdin(_StubStdin):
+        def __init__(self, text: str):
+            super().__init__(is_tty=False)
+            self._pending = list(text)
+
+        def read(self, size: int) -> str:
+            return self._pending.pop(0) if self._pending else ""
+
+    stdin = _ScriptedStdin("wDxK")
+    monkeypatch.setattr(game.sys, "stdin", stdin)
+    monkeypatch.setattr(select, "select", lambda r, w, x, timeout: (r, [], []))
+
+    keyboard = KeyboardInput(
+        {"w": (0, Direction.UP), "D": (1, Direction.RIGHT), "k": (2, Direction.DOWN)}
+    )
+    commands = keyboard.poll()
+
+    assert [(command.snake_id, command.direction) for command in commands] == [
+        (0, Direction.UP),
+        (1, Direction.RIGHT),
+        (2, Direction.DOWN),
+    ]
@@ -54,6 +54,21 @@ class TestFindPath:
         path = find_path(state, 0, Position(4, 4), Position(4, 4))
         assert path == []
 
+    @pytest.mark.parametrize(
+        ("start", "goal"),
+        [
+            (Position(0, 1), Position(12, 0)),
+            (Position(2, 2), Position(14, 1)),
+            (Position(2, 2), Position(-10, 3)),
+        ],
+    )
+    def test_off_board_goal_with_colliding_key_is_unreachable(
+        self, make_state, snake, start, goal
+    ) -> None:
+        state = make_state([snake(0, (2, 2))], width=12)
+        assert goal.y * state.width + goal.x == start.y * state.width + start.x
+        assert find_path(state, 0, start, goal) is None
+
     def test_path_skips_cells_occupied_by_other_snakes(self, make_state, snake) -> None:
         blocker = snake(1, (3, 4), (3, 5), (3, 6))
         state = make_state([snake(0, (2, 5)), blocker])
@@ -61,3 +76,11 @@ class TestFindPath:
         assert path is not None
         blocked = {Position(3, 4), Position(3, 5), Position(3, 6)}
         assert all(coord not in blocked for coord in path)
+
+    def test_repeated_query_returns_independent_copies(self, make_state, snake) -> None:
+        state = make_state([snake(0, (2, 2))])
+        first = find_path(state, 0, Position(2, 2), Position(5, 2))
+        assert first is not None
+        first.clear()
+        second = find_path(state, 0, Position(2, 2), Position(5, 2))
+        assert second == [Position(3, 2), Position(4, 2), Position(5, 2)]